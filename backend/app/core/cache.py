@@ -0,0 +1,41 @@
+import threading
+from typing import Any, Iterable
+from cachetools import Cache
+
+
+class LockedCache:
+    """
+    Thread-safe wrapper around a cachetools cache
+
+    cachetools' mutating operations are not thread-safe, and every cache in
+    this app is touched from FastAPI's threadpool (sync dependencies and
+    endpoints run in worker threads). Even reads mutate: TTLCache expires
+    entries on get and LFUCache bumps hit counters, so every operation goes
+    through the lock. The critical sections are dict lookups - nanoseconds
+    against the I/O these caches exist to avoid.
+    """
+
+    def __init__(self, cache: Cache) -> None:
+        self._cache = cache
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            return self._cache.get(key, default)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._cache[key] = value
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            return self._cache.pop(key, default)
+
+    def items(self) -> Iterable[tuple]:
+        """Snapshot of the entries, taken under the lock"""
+        with self._lock:
+            return list(self._cache.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
@@ -1,10 +1,15 @@
-from pydantic_settings import BaseSettings
+from functools import cached_property, lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = ""
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 30   # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 3600  # recycle connections older than 1 hour
     
     # JWT Settings
     SECRET_KEY: str = ""
@@ -14,15 +19,53 @@ class Settings(BaseSettings):
     
     # Security
     PASSWORD_MIN_LENGTH: int = 8
+    # Argon2id parameters (the primary hash scheme): memory cost is in KiB.
+    # Tunable per deployment so login latency can be traded against cracking
+    # resistance without a code change; hashes minted under old parameters
+    # (or under bcrypt) migrate on next login via needs_rehash in security.py
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536  # 64 MiB
+    ARGON2_PARALLELISM: int = 4
+    # bcrypt work factor, kept for verifying pre-migration hashes
+    BCRYPT_ROUNDS: int = 12
+
+    # Auth cache (verified-token cache in dependencies.py)
+    AUTH_CACHE_SIZE: int = 10_000
+    AUTH_CACHE_TTL: int = 60  # seconds
+
+    # Redis-backed token revocation list (empty = disabled)
+    REDIS_URL: str = ""
     
+    # CORS - explicit lists instead of wildcards so Starlette can take its
+    # fast allow-all-free branch and browsers can cache preflights
+    CORS_ALLOW_ORIGINS: tuple[str, ...] = ("http://localhost:3000",)
+    CORS_ALLOW_METHODS: tuple[str, ...] = ("GET", "POST", "PATCH", "PUT", "DELETE", "OPTIONS")
+    CORS_ALLOW_HEADERS: tuple[str, ...] = ("Authorization", "Content-Type")
+    CORS_MAX_AGE: int = 86400  # let browsers cache preflight responses for a day
+
     # Application
     APP_NAME: str = "Kanemono"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = False
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    @cached_property
+    def SECRET_KEY_BYTES(self) -> bytes:
+        """SECRET_KEY pre-encoded once; the HS256 verifier runs per request"""
+        return self.SECRET_KEY.encode("utf-8")
+
+    # Pydantic v2 config: the old inner Config class goes through a
+    # compatibility shim; frozen=True lets Pydantic pick fast-path validators
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        frozen=True
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build Settings once; repeated calls (tests, reloads) reuse the instance"""
+    return Settings()
 
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
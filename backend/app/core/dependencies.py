@@ -1,58 +1,245 @@
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import Depends, Header, HTTPException, status
+from fastapi.security import HTTPBearer
 from sqlmodel import Session, select
+from sqlalchemy.orm import make_transient_to_detached
 from typing import Optional
+import hashlib
+import time
+from cachetools import LFUCache
+from app.core.cache import LockedCache
 from app.database import get_session
-from app.models.user import User
+from app.models.user import User, UserClaims
+from app.core.config import settings
 from app.core.security import decode_token, verify_token_type
 
-# HTTP Bearer token scheme
-security = HTTPBearer()
+# HTTP Bearer token scheme (kept for the OpenAPI security definition)
+security = HTTPBearer(auto_error=False)
 
+# Shared auth exceptions, built once instead of per request
+CREDENTIALS_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+INVALID_TOKEN_TYPE_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid token type"
+)
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+# Cache of already-verified tokens so hot tokens skip both the JWT decode
+# and the user SELECT on every request.
+# Maps blake2b(token) -> (expires_at, user_id, jti, user column values)
+#
+# LFU eviction instead of LRU/TTL: a scanner flooding the API with unique
+# bogus tokens only ever gives each key a hit count of 1, so the flood
+# evicts itself and never pushes out hot session tokens. Expiry is checked
+# per entry on read (each value carries its own expires_at). Locked because
+# sync dependencies run concurrently in the threadpool.
+_auth_cache = LockedCache(LFUCache(maxsize=settings.AUTH_CACHE_SIZE))
+
+
+# Redis client for the token revocation list (lazy, optional)
+_revocation_store = None
+
+
+def _get_revocation_store():
+    """
+    Return the Redis client for the revocation list, or None when disabled
+    Checking a Redis key is O(1) and ~microseconds, versus a DB round trip
+    """
+    global _revocation_store
+    if not settings.REDIS_URL:
+        return None
+    if _revocation_store is None:
+        import redis
+        _revocation_store = redis.Redis.from_url(settings.REDIS_URL)
+    return _revocation_store
+
+
+def _is_token_revoked(jti: Optional[str]) -> bool:
+    """Check a token's jti against the Redis revocation list"""
+    store = _get_revocation_store()
+    if store is None or jti is None:
+        return False
+    try:
+        return bool(store.exists(f"revoked:{jti}"))
+    except Exception:
+        # Redis outage: fail open and fall back to the in-process auth cache
+        # invalidation, rather than taking down all authenticated traffic
+        return False
+
+
+def revoke_token(token: str) -> None:
+    """
+    Add a token to the revocation list until its natural expiry
+    No-op when Redis is not configured (the in-process cache is still
+    invalidated by the caller)
+    """
+    store = _get_revocation_store()
+    if store is None:
+        return
+    payload = decode_token(token)
+    if payload is None:
+        return
+    jti = payload.get("jti")
+    if jti is None:
+        return
+    ttl = 60
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = max(int(float(exp) - time.time()), 1)
+    try:
+        store.set(f"revoked:{jti}", 1, ex=ttl)
+    except Exception:
+        pass
+
+
+def _extract_bearer(authorization: Optional[str] = Header(None)) -> str:
+    """
+    Pull the raw JWT out of the Authorization header
+
+    Cheaper than HTTPBearer for the one hot format we accept: no regex
+    scheme parsing and no HTTPAuthorizationCredentials allocation per call
+    """
+    if not authorization or authorization[:7] != "Bearer ":
+        raise CREDENTIALS_EXC
+    return authorization[7:]
+
+
+def _get_auth_context(session: Session, user_id: int) -> Optional[User]:
+    """
+    Load everything the auth path needs in a single round trip
+
+    Today that is just the user row. When revocation or team-membership
+    checks land, extend this statement with outer joins instead of issuing
+    extra SELECTs - the auth path should stay at one connection checkout
+    and one network round trip per request.
+    """
+    statement = select(User).where(User.id == user_id)
+    return session.exec(statement).first()
+
+
+def _cache_key(token: str) -> bytes:
+    """Build a short, fixed-size cache key from the raw bearer token"""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """
+    Drop all cached tokens for a user
+    Call this on logout or password change so stale tokens stop resolving
+    """
+    stale_keys = [
+        key for key, (_, cached_user_id, _, _) in _auth_cache.items()
+        if cached_user_id == user_id
+    ]
+    for key in stale_keys:
+        _auth_cache.pop(key, None)
+
+
+def get_current_user(
+    token: str = Depends(_extract_bearer),
     session: Session = Depends(get_session)
 ) -> User:
     """
     Dependency to get the current authenticated user from JWT token
+
+    Deliberately a sync def: this dependency does blocking DB I/O, and as an
+    async def it would run on the event loop and stall it. As a plain def
+    FastAPI runs it in the threadpool alongside the sync endpoints.
+
+    Verified tokens are cached for a short TTL (bounded by the token's own
+    expiry), so repeated requests with the same token skip the HMAC
+    verification and the user query entirely.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    # Extract token
-    token = credentials.credentials
-    
+    # Check the cache first
+    key = _cache_key(token)
+    cached = _auth_cache.get(key)
+    if cached is not None:
+        expires_at, _, jti, user_data = cached
+        if time.time() < expires_at:
+            # Revocation must hold on cache hits too: another worker's
+            # logout only reaches this process through Redis, never through
+            # this in-process cache - and the Redis check is O(1)
+            if _is_token_revoked(jti):
+                _auth_cache.pop(key, None)
+                raise CREDENTIALS_EXC
+            # Rehydrate the user and attach it to this session as persistent,
+            # so updates through it still work without a re-SELECT
+            user = User(**user_data)
+            make_transient_to_detached(user)
+            return session.merge(user, load=False)
+        # Token (or cache entry) expired - fall through to full verification
+        _auth_cache.pop(key, None)
+
     # Decode token
     payload = decode_token(token)
     if payload is None:
-        raise credentials_exception
-    
+        raise CREDENTIALS_EXC
+
     # Verify token type
     if not verify_token_type(payload, "access"):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token type"
-        )
-    
+        raise INVALID_TOKEN_TYPE_EXC
+
+    # Reject revoked tokens (logout, compromised sessions)
+    if _is_token_revoked(payload.get("jti")):
+        raise CREDENTIALS_EXC
+
     # Get user_id from token
     user_id: Optional[int] = payload.get("sub")
     if user_id is None:
-        raise credentials_exception
-    
-    # Fetch user from database
-    statement = select(User).where(User.id == int(user_id))
-    user = session.exec(statement).first()
-    
-    if user is None:
-        raise credentials_exception
-    
+        raise CREDENTIALS_EXC
+
+    # Fetch user (and any future revocation/membership state) in one query
+    user = _get_auth_context(session, int(user_id))
+
+    # user.id can't be None for a persisted row; checking it here once lets
+    # every route use current_user.id directly instead of re-guarding
+    if user is None or user.id is None:
+        raise CREDENTIALS_EXC
+
+    # Cache the verified result, never beyond the token's own expiry
+    expires_at = time.time() + settings.AUTH_CACHE_TTL
+    token_exp = payload.get("exp")
+    if token_exp is not None:
+        expires_at = min(expires_at, float(token_exp))
+    _auth_cache[key] = (expires_at, user.id, payload.get("jti"), user.model_dump())
+
     return user
 
 
+def get_current_user_claims(
+    token: str = Depends(_extract_bearer)
+) -> UserClaims:
+    """
+    Dependency resolving the current user from the JWT payload alone
+
+    Tokens carry id/email/name claims since they were minted with them, so
+    endpoints that only echo identity (/me, /logout) can skip the DB session
+    and the user SELECT entirely. Endpoints that mutate state should keep
+    depending on get_current_user for the ORM object.
+    """
+    payload = decode_token(token)
+    if payload is None:
+        raise CREDENTIALS_EXC
+
+    if not verify_token_type(payload, "access"):
+        raise INVALID_TOKEN_TYPE_EXC
+
+    if _is_token_revoked(payload.get("jti")):
+        raise CREDENTIALS_EXC
+
+    user_id = payload.get("sub")
+    email = payload.get("email")
+    name = payload.get("name")
+    if user_id is None or email is None or name is None:
+        # Tokens minted before identity claims were embedded: force a fresh
+        # login rather than guessing (access tokens are short-lived anyway)
+        raise CREDENTIALS_EXC
+
+    return UserClaims.model_construct(id=int(user_id), email=email, name=name)
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -62,4 +249,4 @@ async def get_current_active_user(
     # You can add is_active field to User model later
     # if not current_user.is_active:
     #     raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
\ No newline at end of file
+    return current_user
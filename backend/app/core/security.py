@@ -2,11 +2,41 @@ from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from cachetools import TTLCache
+import base64
 import hashlib
+import hmac
+import orjson
+import time
+import uuid
+from app.core.cache import LockedCache
 from app.core.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context - built once at import so the backends are
+# loaded and configured before the first request. Argon2id is the primary
+# scheme (memory-hard, so GPU/ASIC cracking of a leaked dump doesn't scale
+# the way bcrypt does); bcrypt stays verifiable and deprecated="auto" marks
+# its hashes for the rehash-on-login migration. All parameters come from
+# settings so cost is deliberate and tunable per deployment. Hashing is
+# still ~100s of ms of CPU, which is why login/register stay sync `def`
+# endpoints (they run in the threadpool, off the event loop).
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
+
+
+# An argon2id hash of a throwaway password, minted at import through the
+# configured context so it always carries the deployment's ARGON2_* cost
+# parameters - verifying it burns the same CPU as a real check. Without it,
+# missing accounts answer in microseconds while real ones take the full
+# hashing cost - a timing oracle for user enumeration. (A hardcoded hash
+# would drift from tuned settings and partially reopen the oracle.)
+DUMMY_PASSWORD_HASH = pwd_context.hash(uuid.uuid4().hex)
 
 
 def _normalize_password(password: str) -> str:
@@ -38,6 +68,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(normalized, hashed_password)
 
 
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash predates the current work factor
+
+    Lets authenticate_user upgrade old hashes on the next successful login
+    after BCRYPT_ROUNDS changes - no flag-day migration needed
+    """
+    return pwd_context.needs_update(hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
@@ -47,7 +87,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire, "type": "access"})
+    # jti makes individual tokens addressable by the revocation list
+    to_encode.update({"exp": expire, "type": "access", "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -56,19 +97,78 @@ def create_refresh_token(data: dict) -> str:
     """Create JWT refresh token"""
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.update({"exp": expire, "type": "refresh", "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
+def _b64url_decode(segment: bytes) -> bytes:
+    """Decode a base64url segment, re-adding the padding JWTs strip"""
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+# Memo of recently verified tokens: the same session re-presents the same
+# token on every request, so signature verification only has to happen once
+# per token per TTL window. Expiry is still enforced on every call (below),
+# so a cached payload can never outlive its own exp claim. Locked because
+# this runs from the threadpool on every authenticated request.
+_decode_cache = LockedCache(TTLCache(maxsize=10_000, ttl=30))
+
+
 def decode_token(token: str) -> Optional[dict]:
-    """Decode and verify JWT token"""
+    """
+    Decode and verify JWT token
+
+    Verified payloads are memoized for a short TTL keyed by the raw token,
+    amortizing signature verification across repeated requests from the
+    same session. The exp claim is re-checked on every call.
+    """
+    payload = _decode_cache.get(token)
+    if payload is None:
+        payload = _verify_token(token)
+        if payload is None:
+            # Don't cache failures: a flood of unique garbage tokens would
+            # churn the cache without ever getting a second lookup anyway
+            return None
+        _decode_cache[token] = payload
+
+    # Enforce expiry like jose's decode does - on cache hits too
+    exp = payload.get("exp")
+    if exp is not None and time.time() > float(exp):
+        return None
+
+    return payload
+
+
+def _verify_token(token: str) -> Optional[dict]:
+    """
+    Verify a JWT's signature and return its payload (no expiry check)
+
+    HS256 tokens are verified directly with hmac/hashlib (OpenSSL's
+    SHA-256, hardware-accelerated where available) instead of going through
+    python-jose's per-call object construction - this path runs on every
+    authenticated request. Other algorithms fall back to python-jose.
+    """
+    if settings.ALGORITHM != "HS256":
+        try:
+            return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except JWTError:
+            return None
+
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+        header_b64, payload_b64, signature_b64 = token.encode("ascii").split(b".")
+        signing_input = header_b64 + b"." + payload_b64
+        expected = hmac.new(settings.SECRET_KEY_BYTES, signing_input, "sha256").digest()
+        # compare_digest keeps the check constant-time; computing HMAC-SHA256
+        # unconditionally also closes off "alg" header confusion
+        if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+            return None
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except (ValueError, TypeError):
         return None
 
+    return payload
+
 
 def verify_token_type(payload: Optional[dict], expected_type: str) -> bool:
     """Verify token type (access or refresh)"""
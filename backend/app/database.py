@@ -1,15 +1,19 @@
 from sqlmodel import create_engine, Session, SQLModel, text
+from sqlalchemy import inspect
 from typing import Generator
 from app.core.config import settings
 
-# Create database engine
-# echo=True will print all SQL queries (useful for debugging, disable in production)
+# Create database engine (single module-level instance, shared by the app)
+# echo stays tied to DEBUG: with echo=True every statement is formatted and
+# pushed through Python logging, which is a real throughput sink in production
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,  # Show SQL queries in console when DEBUG=True
     pool_pre_ping=True,   # Verify connections before using them
-    pool_size=10,         # Number of connections to keep in pool
-    max_overflow=20       # Maximum overflow connections
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE
 )
 
 
@@ -22,22 +26,58 @@ def create_db_and_tables():
     from app.models.user import User
     from app.models.account import Account
     from app.models.category import Category
-    from app.models.transaction import Transaction, TransactionLine
+    from app.models.transaction import Transaction, TransactionLine, transaction_number_seq
     from app.models.recurring import Recurring, RecurringLine
     from app.models.attachment import Attachment
     from app.models.budget import Budget
     
-    # Create all tables
-    SQLModel.metadata.create_all(engine)
+    # The transaction number sequence lives outside any table's DDL, so it
+    # is created explicitly (no-op when present or on sequence-less dialects)
+    if engine.dialect.supports_sequences:
+        transaction_number_seq.create(engine, checkfirst=True)
+
+    # The trigram search index on accounts needs pg_trgm (Postgres only)
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as connection:
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    # One catalog query instead of create_all's per-table existence probe;
+    # on a warm database (dev auto-reload, worker restarts) we skip entirely
+    existing_tables = set(inspect(engine).get_table_names())
+    missing_tables = [
+        table for table in SQLModel.metadata.sorted_tables
+        if table.name not in existing_tables
+    ]
+
+    if not missing_tables:
+        print("✅ Database tables already exist, skipping create_all")
+        return
+
+    SQLModel.metadata.create_all(engine, tables=missing_tables, checkfirst=False)
     print("✅ Database tables created successfully!")
 
 
+def warm_up_pool():
+    """
+    Open pool_size physical connections before accepting traffic
+    The pool only connects on demand, so without this the first wave of
+    concurrent requests each pays the TCP/TLS/auth handshake to Postgres
+    """
+    connections = [engine.connect() for _ in range(settings.DB_POOL_SIZE)]
+    for connection in connections:
+        connection.close()
+    print(f"✅ Connection pool warmed up ({settings.DB_POOL_SIZE} connections)!")
+
+
 def get_session() -> Generator[Session, None, None]:
     """
     Dependency function to get database session
     Usage in FastAPI endpoints: session: Session = Depends(get_session)
     """
-    with Session(engine) as session:
+    # expire_on_commit=False: request sessions are short-lived, so keeping
+    # attributes loaded after commit is safe and avoids the implicit
+    # re-SELECT that serializing a just-committed object would otherwise pay
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
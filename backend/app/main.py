@@ -1,9 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-from app.database import create_db_and_tables, test_connection
-from app.routers import auth_router, accounts_router, categories_router
+from sqlalchemy.orm import configure_mappers
+import asyncio
+from app.database import create_db_and_tables, test_connection, warm_up_pool
+from app.routers import auth_router, accounts_router, categories_router, transactions_router
 from app.core.config import settings
 
 
@@ -13,13 +16,25 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting application...")
     
+    # Startup DB work is all blocking I/O - run it in the threadpool so the
+    # event loop (and e.g. health probes on other workers) isn't stalled
+
     # Test database connection
-    if not test_connection():
+    if not await asyncio.to_thread(test_connection):
         raise Exception("Failed to connect to database!")
-    
+
     # Create tables
-    create_db_and_tables()
-    
+    await asyncio.to_thread(create_db_and_tables)
+
+    # Resolve every string-based relationship ("User", "Category", ...) in
+    # the mapper registry now - otherwise the first ORM query pays the full
+    # configure pass. All model modules are imported by this point.
+    configure_mappers()
+
+    # Open all pooled connections up-front so the first requests don't
+    # each pay the Postgres handshake
+    await asyncio.to_thread(warm_up_pool)
+
     print("✅ Application started successfully!")
     
     yield
@@ -33,22 +48,25 @@ app = FastAPI(
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
     lifespan=lifespan,
-    description="Personal Accounting Application API with double-entry bookkeeping"
+    description="Personal Accounting Application API with double-entry bookkeeping",
+    default_response_class=ORJSONResponse  # orjson is much faster than stdlib json
 )
 
-# CORS middleware
+# CORS middleware - origins/methods/headers come from Settings
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production: specify allowed origins
+    allow_origins=list(settings.CORS_ALLOW_ORIGINS),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=list(settings.CORS_ALLOW_METHODS),
+    allow_headers=list(settings.CORS_ALLOW_HEADERS),
+    max_age=settings.CORS_MAX_AGE,
 )
 
 # Include routers
 app.include_router(auth_router)
 app.include_router(accounts_router)
 app.include_router(categories_router)
+app.include_router(transactions_router)
 
 
 # Custom OpenAPI schema for Bearer authentication
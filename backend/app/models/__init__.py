@@ -1,78 +1,74 @@
-from .user import User, UserCreate, UserRead, UserUpdate
-from .account import (
-    Account, 
-    AccountCreate, 
-    AccountRead, 
-    AccountUpdate,
-    AccountType,
-    NormalBalance
-)
-from .category import (
-    Category, 
-    CategoryCreate, 
-    CategoryRead, 
-    CategoryUpdate,
-    CategoryType
-)
-from .transaction import (
-    Transaction,
-    TransactionLine,
-    TransactionCreate,
-    TransactionRead,
-    TransactionUpdate,
-    TransactionLineCreate,
-    TransactionLineRead,
-    TransactionLineUpdate,
-    TransactionType,
-    LineType
-)
-from .recurring import (
-    Recurring,
-    RecurringLine,
-    RecurringCreate,
-    RecurringRead,
-    RecurringUpdate,
-    RecurringLineCreate,
-    RecurringLineRead,
-    Frequency
-)
-from .attachment import (
-    Attachment,
-    AttachmentCreate,
-    AttachmentRead,
-    AttachmentUpdate
-)
-from .budget import (
-    Budget,
-    BudgetCreate,
-    BudgetRead,
-    BudgetUpdate,
-    Period
-)
+# Lazy re-exports (PEP 562): importing app.models no longer pulls in all
+# seven model modules eagerly, so workers only pay for the SQLModel metadata
+# and Pydantic validators of the models they actually touch. Each name is
+# resolved on first access and cached in the module namespace.
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = [
+_MODULE_BY_NAME = {
     # User
-    "User", "UserCreate", "UserRead", "UserUpdate",
-    
+    "User": "user", "UserCreate": "user", "UserRead": "user", "UserUpdate": "user",
+
     # Account
-    "Account", "AccountCreate", "AccountRead", "AccountUpdate", 
-    "AccountType", "NormalBalance",
-    
+    "Account": "account", "AccountCreate": "account", "AccountRead": "account",
+    "AccountUpdate": "account", "AccountType": "account", "NormalBalance": "account",
+
     # Category
-    "Category", "CategoryCreate", "CategoryRead", "CategoryUpdate", "CategoryType",
-    
+    "Category": "category", "CategoryCreate": "category", "CategoryRead": "category",
+    "CategoryUpdate": "category", "CategoryType": "category",
+
     # Transaction
-    "Transaction", "TransactionLine", "TransactionCreate", "TransactionRead",
-    "TransactionUpdate", "TransactionLineCreate", "TransactionLineRead",
-    "TransactionLineUpdate", "TransactionType", "LineType",
-    
+    "Transaction": "transaction", "TransactionLine": "transaction",
+    "TransactionCreate": "transaction", "TransactionRead": "transaction",
+    "TransactionUpdate": "transaction", "TransactionLineCreate": "transaction",
+    "TransactionLineRead": "transaction", "TransactionLineUpdate": "transaction",
+    "TransactionType": "transaction", "LineType": "transaction",
+
     # Recurring
-    "Recurring", "RecurringLine", "RecurringCreate", "RecurringRead",
-    "RecurringUpdate", "RecurringLineCreate", "RecurringLineRead", "Frequency",
-    
+    "Recurring": "recurring", "RecurringLine": "recurring",
+    "RecurringCreate": "recurring", "RecurringRead": "recurring",
+    "RecurringUpdate": "recurring", "RecurringLineCreate": "recurring",
+    "RecurringLineRead": "recurring", "Frequency": "recurring",
+
     # Attachment
-    "Attachment", "AttachmentCreate", "AttachmentRead", "AttachmentUpdate",
-    
+    "Attachment": "attachment", "AttachmentCreate": "attachment",
+    "AttachmentRead": "attachment", "AttachmentUpdate": "attachment",
+
     # Budget
-    "Budget", "BudgetCreate", "BudgetRead", "BudgetUpdate", "Period"
-]
\ No newline at end of file
+    "Budget": "budget", "BudgetCreate": "budget", "BudgetRead": "budget",
+    "BudgetUpdate": "budget", "Period": "budget",
+}
+
+__all__ = tuple(_MODULE_BY_NAME)
+
+if TYPE_CHECKING:
+    # Static analyzers and IDEs still see the eager imports
+    from .user import User, UserCreate, UserRead, UserUpdate
+    from .account import (
+        Account, AccountCreate, AccountRead, AccountUpdate,
+        AccountType, NormalBalance
+    )
+    from .category import (
+        Category, CategoryCreate, CategoryRead, CategoryUpdate, CategoryType
+    )
+    from .transaction import (
+        Transaction, TransactionLine, TransactionCreate, TransactionRead,
+        TransactionUpdate, TransactionLineCreate, TransactionLineRead,
+        TransactionLineUpdate, TransactionType, LineType
+    )
+    from .recurring import (
+        Recurring, RecurringLine, RecurringCreate, RecurringRead,
+        RecurringUpdate, RecurringLineCreate, RecurringLineRead, Frequency
+    )
+    from .attachment import Attachment, AttachmentCreate, AttachmentRead, AttachmentUpdate
+    from .budget import Budget, BudgetCreate, BudgetRead, BudgetUpdate, Period
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _MODULE_BY_NAME[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so __getattr__ only runs once per name
+    return value
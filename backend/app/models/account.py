@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import BigInteger, Column, DateTime, Index, UniqueConstraint, func
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 from decimal import Decimal
@@ -45,13 +46,52 @@ class AccountBase(SQLModel):
 
 class Account(AccountBase, table=True):
     __tablename__ = "accounts" # type: ignore
-    
+    # Fetch server defaults (created_at/updated_at) in the INSERT/UPDATE's
+    # own RETURNING clause, so no refresh SELECT is needed after a write
+    __mapper_args__ = {"eager_defaults": True}
+
+    # The DB enforces code uniqueness per user, so the create/update paths
+    # can insert directly and translate IntegrityError instead of paying a
+    # pre-check SELECT (which was racy anyway); the unique (user_id, code)
+    # index doubles as the scan order for the code-sorted list and tree
+    # queries, and (user_id, parent_id) serves child lookups (delete-time
+    # guard, subtree queries) without a table scan.
+    # The trigram GIN index makes the search endpoint's leading-% ILIKE
+    # predicates indexable on Postgres (btree can't serve '%term%'); needs
+    # the pg_trgm extension, created in create_db_and_tables. Other
+    # dialects just get a plain index and keep scanning
+    __table_args__ = (
+        UniqueConstraint("user_id", "code", name="uq_accounts_user_code"),
+        Index("ix_accounts_user_parent", "user_id", "parent_id"),
+        Index(
+            "ix_accounts_search_trgm", "code", "name", "description",
+            postgresql_using="gin",
+            postgresql_ops={
+                "code": "gin_trgm_ops",
+                "name": "gin_trgm_ops",
+                "description": "gin_trgm_ops"
+            }
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
     parent_id: Optional[int] = Field(default=None, foreign_key="accounts.id")
-    balance: Decimal = Field(default=Decimal("0.00"), max_digits=15, decimal_places=2)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Balance stored as int64 minor units (cents): SUM(bigint) is far cheaper
+    # than SUM(numeric) in Postgres and avoids Decimal objects in Python.
+    # Read schemas convert back to a Decimal amount, so the API is unchanged
+    balance: int = Field(
+        default=0,
+        sa_column=Column(BigInteger, nullable=False, server_default="0")
+    )
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    )
     
     # Relationships
     user: "User" = Relationship(back_populates="accounts")
@@ -102,7 +142,14 @@ class AccountRead(AccountBase):
     balance: Decimal
     created_at: datetime
     updated_at: datetime
-    
+
+    @field_validator('balance', mode='before')
+    def balance_from_minor_units(cls, v):
+        """Convert stored integer cents back to a Decimal amount"""
+        if isinstance(v, int):
+            return Decimal(v).scaleb(-2)
+        return v
+
     # class Config:
     #     from_attributes = True
 
@@ -125,7 +172,14 @@ class AccountTree(SQLModel):
     balance: Decimal
     is_active: bool
     children: List['AccountTree'] = []
-    
+
+    @field_validator('balance', mode='before')
+    def balance_from_minor_units(cls, v):
+        """Convert stored integer cents back to a Decimal amount"""
+        if isinstance(v, int):
+            return Decimal(v).scaleb(-2)
+        return v
+
     # class Config:
     #     from_attributes = True
 
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Column, DateTime, func
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
@@ -18,7 +19,10 @@ class Attachment(AttachmentBase, table=True):
     
     id: Optional[int] = Field(default=None, primary_key=True)
     transaction_id: int = Field(foreign_key="transactions.id", index=True)
-    uploaded_at: datetime = Field(default_factory=datetime.utcnow)
+    uploaded_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )
     
     # Relationships
     transaction: "Transaction" = Relationship(back_populates="attachments")
@@ -1,8 +1,10 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import BigInteger, Column, DateTime, func
 from datetime import datetime, date
 from typing import Optional, TYPE_CHECKING
 from decimal import Decimal
 from enum import Enum
+from pydantic import field_validator
 
 if TYPE_CHECKING:
     from .user import User
@@ -31,8 +33,28 @@ class Budget(BudgetBase, table=True):
     user_id: int = Field(foreign_key="users.id", index=True)
     account_id: int = Field(foreign_key="accounts.id", index=True)
     category_id: Optional[int] = Field(default=None, foreign_key="categories.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Stored as int64 minor units (cents) - see Account.balance
+    amount: int = Field(default=0, sa_column=Column(BigInteger, nullable=False))
+
+    @field_validator('amount', mode='before')
+    def amount_to_minor_units(cls, v):
+        """Convert a Decimal amount from the Create/Update schemas to cents
+
+        Runs on Budget.model_validate(...), the standard create path, so
+        services can't accidentally store major units in the cents column
+        """
+        if isinstance(v, Decimal):
+            return int(v * 100)
+        return v
+
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    )
     
     # Relationships
     user: "User" = Relationship(back_populates="budgets")
@@ -54,6 +76,13 @@ class BudgetRead(BudgetBase):
     created_at: datetime
     updated_at: datetime
 
+    @field_validator('amount', mode='before')
+    def amount_from_minor_units(cls, v):
+        """Convert stored integer cents back to a Decimal amount"""
+        if isinstance(v, int):
+            return Decimal(v).scaleb(-2)
+        return v
+
 
 class BudgetUpdate(SQLModel):
     amount: Optional[Decimal] = None
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Column, DateTime, Index, UniqueConstraint, func, text
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 from enum import Enum
@@ -23,11 +24,33 @@ class CategoryBase(SQLModel):
 
 class Category(CategoryBase, table=True):
     __tablename__ = "categories" # type: ignore
-    
+    # Fetch server defaults (created_at/updated_at) in the INSERT/UPDATE's
+    # own RETURNING clause, so no refresh SELECT is needed after a write
+    __mapper_args__ = {"eager_defaults": True}
+    # Same-name siblings are rejected by the DB rather than a pre-check
+    # SELECT. NULL parent_id values compare distinct in the constraint, so
+    # root categories need the partial unique index below to stay covered
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "parent_id", "name",
+            name="uq_categories_user_parent_name"
+        ),
+        Index(
+            "uq_categories_user_root_name",
+            "user_id", "name",
+            unique=True,
+            postgresql_where=text("parent_id IS NULL"),
+            sqlite_where=text("parent_id IS NULL")
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
     parent_id: Optional[int] = Field(default=None, foreign_key="categories.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )
     
     # Relationships
     user: "User" = Relationship(back_populates="categories")
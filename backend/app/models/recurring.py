@@ -1,8 +1,10 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import BigInteger, Column, DateTime, func
 from datetime import datetime, date
 from typing import Optional, TYPE_CHECKING
 from decimal import Decimal
 from enum import Enum
+from pydantic import field_validator
 
 if TYPE_CHECKING:
     from .user import User
@@ -38,8 +40,14 @@ class Recurring(RecurringBase, table=True):
     category_id: Optional[int] = Field(default=None, foreign_key="categories.id")
     next_date: Optional[date] = None
     last_date: Optional[date] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    )
     
     # Relationships
     user: "User" = Relationship(back_populates="recurring")
@@ -61,7 +69,21 @@ class RecurringLine(RecurringLineBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     recurring_id: int = Field(foreign_key="recurring.id", index=True)
     account_id: int = Field(foreign_key="accounts.id", index=True)
-    
+    # Stored as int64 minor units (cents) - see Account.balance
+    amount: int = Field(default=0, sa_column=Column(BigInteger, nullable=False))
+
+    @field_validator('amount', mode='before')
+    def amount_to_minor_units(cls, v):
+        """Convert a Decimal amount from the Create/Update schemas to cents
+
+        Runs on RecurringLine.model_validate(...), the standard create
+        path, so services can't accidentally store major units in the
+        cents column
+        """
+        if isinstance(v, Decimal):
+            return int(v * 100)
+        return v
+
     # Relationships
     recurring: Recurring = Relationship(back_populates="lines")
     account: "Account" = Relationship(back_populates="recurring_lines")
@@ -84,6 +106,13 @@ class RecurringLineRead(RecurringLineBase):
     recurring_id: int
     account_id: int
 
+    @field_validator('amount', mode='before')
+    def amount_from_minor_units(cls, v):
+        """Convert stored integer cents back to a Decimal amount"""
+        if isinstance(v, int):
+            return Decimal(v).scaleb(-2)
+        return v
+
 
 class RecurringRead(RecurringBase):
     id: int
@@ -1,8 +1,10 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import BigInteger, Column, DateTime, Index, Sequence, String, func, text
 from datetime import datetime, date
-from typing import Optional, TYPE_CHECKING
+from typing import Literal, Optional, TYPE_CHECKING
 from decimal import Decimal
 from enum import Enum
+from pydantic import field_validator
 
 if TYPE_CHECKING:
     from .user import User
@@ -24,6 +26,12 @@ class LineType(str, Enum):
     CREDIT = "Credit"
 
 
+# Transaction numbers come from the database: a sequence behind a server
+# default is atomic under concurrent inserts, with no MAX()+1 query or
+# extra round trip from Python (created in create_db_and_tables)
+transaction_number_seq = Sequence("transactions_number_seq")
+
+
 # Transaction Header
 class TransactionBase(SQLModel):
     date: date
@@ -36,21 +44,57 @@ class TransactionBase(SQLModel):
 
 class Transaction(TransactionBase, table=True):
     __tablename__ = "transactions" # type: ignore
-    
+    # Composite index: listing is always per-user ordered by date, so the
+    # planner gets a range scan with no sort; the user_id prefix also covers
+    # plain user_id lookups, so no standalone index needed
+    __table_args__ = (
+        Index("ix_transactions_user_date", "user_id", "date"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
-    number: Optional[str] = Field(default=None, max_length=50)
+    user_id: int = Field(foreign_key="users.id")
+    number: Optional[str] = Field(
+        default=None,
+        sa_column=Column(
+            String(50),
+            server_default=text("('TXN-' || nextval('transactions_number_seq'))")
+        )
+    )
     category_id: Optional[int] = Field(default=None, foreign_key="categories.id")
     recurring_id: Optional[int] = Field(default=None, foreign_key="recurring.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    )
     
     # Relationships
-    user: "User" = Relationship(back_populates="transactions")
-    category: Optional["Category"] = Relationship(back_populates="transactions")
-    recurring: Optional["Recurring"] = Relationship(back_populates="transactions")
-    lines: list["TransactionLine"] = Relationship(back_populates="transaction", cascade_delete=True)
-    attachments: list["Attachment"] = Relationship(back_populates="transaction", cascade_delete=True)
+    # Explicit lazy strategies: joined for many-to-one (one JOIN, no extra
+    # round trip), selectin for collections (one batched SELECT per query
+    # instead of one per row when serializing TransactionRead.lines)
+    user: "User" = Relationship(
+        back_populates="transactions",
+        sa_relationship_kwargs={"lazy": "joined"}
+    )
+    category: Optional["Category"] = Relationship(
+        back_populates="transactions",
+        sa_relationship_kwargs={"lazy": "joined"}
+    )
+    recurring: Optional["Recurring"] = Relationship(
+        back_populates="transactions",
+        sa_relationship_kwargs={"lazy": "joined"}
+    )
+    lines: list["TransactionLine"] = Relationship(
+        back_populates="transaction", cascade_delete=True,
+        sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    attachments: list["Attachment"] = Relationship(
+        back_populates="transaction", cascade_delete=True,
+        sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
 # Transaction Line (Debit/Credit)
@@ -62,25 +106,47 @@ class TransactionLineBase(SQLModel):
 
 class TransactionLine(TransactionLineBase, table=True):
     __tablename__ = "transaction_lines" # type: ignore
-    
+    # Composite index serves the batched selectinload of lines per
+    # transaction (prefix covers transaction_id-only lookups); account_id
+    # keeps its own index for per-account balance queries
+    __table_args__ = (
+        Index("ix_txn_lines_txn_account", "transaction_id", "account_id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    transaction_id: int = Field(foreign_key="transactions.id", index=True)
+    transaction_id: int = Field(foreign_key="transactions.id")
     account_id: int = Field(foreign_key="accounts.id", index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Stored as int64 minor units (cents) - see Account.balance
+    amount: int = Field(default=0, sa_column=Column(BigInteger, nullable=False))
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )
     
     # Relationships
-    transaction: Transaction = Relationship(back_populates="lines")
-    account: "Account" = Relationship(back_populates="transaction_lines")
+    transaction: Transaction = Relationship(
+        back_populates="lines",
+        sa_relationship_kwargs={"lazy": "joined"}
+    )
+    account: "Account" = Relationship(
+        back_populates="transaction_lines",
+        sa_relationship_kwargs={"lazy": "joined"}
+    )
 
 
 # Create schemas
+# Literal[str, ...] on request schemas hits pydantic-core's interned-string
+# fast path instead of Enum.__call__ per field; the table models keep the
+# real enums and the service coerces once on the way in
 class TransactionLineCreate(TransactionLineBase):
     account_id: int
+    type: Literal["Debit", "Credit"]
 
 
 class TransactionCreate(TransactionBase):
     user_id: int
     category_id: Optional[int] = None
+    type: Literal["income", "expense", "transfer", "adjustment"]
     lines: list[TransactionLineCreate]
 
 
@@ -91,6 +157,13 @@ class TransactionLineRead(TransactionLineBase):
     account_id: int
     created_at: datetime
 
+    @field_validator('amount', mode='before')
+    def amount_from_minor_units(cls, v):
+        """Convert stored integer cents back to a Decimal amount"""
+        if isinstance(v, int):
+            return Decimal(v).scaleb(-2)
+        return v
+
 
 class TransactionRead(TransactionBase):
     id: int
@@ -106,16 +179,22 @@ class TransactionRead(TransactionBase):
 # Update schemas
 class TransactionLineUpdate(SQLModel):
     account_id: Optional[int] = None
-    type: Optional[LineType] = None
+    type: Optional[Literal["Debit", "Credit"]] = None
     amount: Optional[Decimal] = None
     description: Optional[str] = None
 
 
 class TransactionUpdate(SQLModel):
     date: Optional[date] = None
-    type: Optional[TransactionType] = None
+    type: Optional[Literal["income", "expense", "transfer", "adjustment"]] = None
     category_id: Optional[int] = None
     description: Optional[str] = None
     reference: Optional[str] = None
     notes: Optional[str] = None
-    is_posted: Optional[bool] = None
\ No newline at end of file
+    is_posted: Optional[bool] = None
+
+# Resolve forward refs and compile the pydantic-core validators once at
+# import, instead of lazily on the first request each worker serves
+if not TYPE_CHECKING:
+    TransactionLineRead.model_rebuild()
+    TransactionRead.model_rebuild()
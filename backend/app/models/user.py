@@ -1,7 +1,24 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Column, DateTime, func
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
-from pydantic import EmailStr
+from typing import Annotated, Optional, TYPE_CHECKING
+from pydantic import EmailStr, StringConstraints
+
+# Shape-only email type for hot paths: pydantic-core matches one compiled
+# pattern instead of running email-validator's DNS-label parsing and IDNA
+# encoding per validation. Login sees credential-stuffing volumes, so the
+# cheap check matters there; full EmailStr stays on registration where
+# deliverability-grade validation is worth the cost.
+EmailStrFast = Annotated[
+    str,
+    StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=255)
+]
+
+# Shared password types: one Annotated alias per constraint set means
+# pydantic-core builds (and caches) a single schema node reused by every
+# model that accepts a password, instead of one per field
+PasswordStr = Annotated[str, StringConstraints(min_length=8, max_length=128)]
+PasswordInputStr = Annotated[str, StringConstraints(max_length=128)]
 
 if TYPE_CHECKING:
     from .account import Account
@@ -22,18 +39,45 @@ class UserBase(SQLModel):
 
 class User(UserBase, table=True):
     __tablename__ = "users" # type: ignore
-    
+    # Fetch server defaults (created_at/updated_at) in the INSERT's own
+    # RETURNING clause, so no refresh SELECT is needed after creating a row
+    __mapper_args__ = {"eager_defaults": True}
+
     id: Optional[int] = Field(default=None, primary_key=True)
     password_hash: str = Field(max_length=255)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    )
     
     # Relationships
-    accounts: list["Account"] = Relationship(back_populates="user", cascade_delete=True)
-    categories: list["Category"] = Relationship(back_populates="user", cascade_delete=True)
-    transactions: list["Transaction"] = Relationship(back_populates="user", cascade_delete=True)
-    recurring: list["Recurring"] = Relationship(back_populates="user", cascade_delete=True)
-    budgets: list["Budget"] = Relationship(back_populates="user", cascade_delete=True)
+    # lazy="raise": these collections can be huge, so callers must opt in
+    # explicitly with selectinload(...) instead of silently issuing one
+    # SELECT per attribute access
+    accounts: list["Account"] = Relationship(
+        back_populates="user", cascade_delete=True,
+        sa_relationship_kwargs={"lazy": "raise"}
+    )
+    categories: list["Category"] = Relationship(
+        back_populates="user", cascade_delete=True,
+        sa_relationship_kwargs={"lazy": "raise"}
+    )
+    transactions: list["Transaction"] = Relationship(
+        back_populates="user", cascade_delete=True,
+        sa_relationship_kwargs={"lazy": "raise"}
+    )
+    recurring: list["Recurring"] = Relationship(
+        back_populates="user", cascade_delete=True,
+        sa_relationship_kwargs={"lazy": "raise"}
+    )
+    budgets: list["Budget"] = Relationship(
+        back_populates="user", cascade_delete=True,
+        sa_relationship_kwargs={"lazy": "raise"}
+    )
 
 
 # ============================================
@@ -42,7 +86,7 @@ class User(UserBase, table=True):
 
 class UserCreate(UserBase):
     """Schema for user registration"""
-    password: str = Field(min_length=8, max_length=128)
+    password: PasswordStr
 
 
 class UserRead(UserBase):
@@ -54,14 +98,14 @@ class UserRead(UserBase):
 
 class UserUpdate(SQLModel):
     """Schema for updating user profile"""
-    email: Optional[EmailStr] = None
+    email: Optional[EmailStrFast] = None
     name: Optional[str] = None
 
 
 class UserLogin(SQLModel):
     """Schema for login request"""
-    email: EmailStr
-    password: str = Field(max_length=128)
+    email: EmailStrFast
+    password: PasswordInputStr
 
 
 class TokenResponse(SQLModel):
@@ -78,12 +122,26 @@ class RefreshTokenRequest(SQLModel):
 
 class ChangePasswordRequest(SQLModel):
     """Schema for changing password"""
-    current_password: str = Field(max_length=128)
-    new_password: str = Field(min_length=8, max_length=128)
+    current_password: PasswordInputStr
+    new_password: PasswordStr
 
 
 class UserProfile(SQLModel):
     """Schema for user profile (alias for UserRead)"""
     id: int
     email: str
-    name: str
\ No newline at end of file
+    name: str
+
+
+class UserClaims(SQLModel):
+    """Identity claims embedded in the JWT payload (no DB row behind them)"""
+    id: int
+    email: str
+    name: str
+
+# Resolve forward refs and compile the pydantic-core validators once at
+# import, instead of lazily on the first request each worker serves
+if not TYPE_CHECKING:
+    UserRead.model_rebuild()
+    UserProfile.model_rebuild()
+    TokenResponse.model_rebuild()
@@ -1,5 +1,6 @@
 from .auth import router as auth_router
 from .accounts import router as accounts_router
 from .categories import router as categories_router
+from .transactions import router as transactions_router
 
-__all__ = ["auth_router", "accounts_router", "categories_router"]
\ No newline at end of file
+__all__ = ["auth_router", "accounts_router", "categories_router", "transactions_router"]
\ No newline at end of file
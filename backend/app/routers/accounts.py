@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
-from typing import Optional, List
+from typing import Iterator, Optional, List
+import orjson
 from app.database import get_session
 from app.models.user import User
 from app.models.account import (
@@ -25,11 +27,6 @@ def create_account(
     
     **Requires authentication**
     """
-    if current_user.id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User ID is required"
-        )
     return AccountService.create_account(session, account, current_user.id)
 
 
@@ -48,11 +45,6 @@ def list_accounts(
     
     **Requires authentication**
     """
-    if current_user.id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User ID is required"
-        )
     skip = (page - 1) * page_size
     accounts, total = AccountService.get_accounts(
         session=session,
@@ -63,13 +55,29 @@ def list_accounts(
         skip=skip,
         limit=page_size
     )
-    
-    return AccountListResponse(
-        total=total,
-        page=page,
-        page_size=page_size,
-        accounts=[AccountRead.model_validate(account) for account in accounts]
-    )
+
+    # Bind the compiled pydantic-core validator directly: skips the
+    # model_validate classmethod dispatch on every row
+    validate_account = AccountRead.__pydantic_validator__.validate_python
+
+    def render() -> Iterator[bytes]:
+        # Stream the envelope by hand: one validated row in memory at a
+        # time instead of the whole page plus its pydantic copies. The DB
+        # session stays open while this runs - FastAPI tears down the
+        # get_session dependency only after the response has been sent
+        yield b'{"total":%d,"page":%d,"page_size":%d,"accounts":[' % (
+            total, page, page_size
+        )
+        separator = b""
+        for account in accounts:
+            row = validate_account(account, from_attributes=True)
+            yield separator + orjson.dumps(row.model_dump(mode="json"))
+            separator = b","
+        yield b"]}"
+
+    # Streaming also skips FastAPI's second response_model validation pass
+    # and its reflective jsonable_encoder walk over every row
+    return StreamingResponse(render(), media_type="application/json")
 
 
 @router.get("/tree", response_model=List[AccountTree])
@@ -84,25 +92,7 @@ def get_account_tree(
     
     **Requires authentication**
     """
-    if current_user.id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User ID is required"
-        )
-    root_accounts = AccountService.get_account_tree(session, current_user.id)
-    
-    def build_tree(account: Account) -> AccountTree:
-        return AccountTree(
-            id=account.id, # type: ignore
-            code=account.code,
-            name=account.name,
-            type=account.type,
-            balance=account.balance,
-            is_active=account.is_active,
-            children=[build_tree(child) for child in account.children]
-        )
-    
-    return [build_tree(account)  for account in root_accounts]
+    return AccountService.get_account_tree(session, current_user.id)
 
 
 @router.get("/summary", response_model=AccountSummary)
@@ -117,11 +107,6 @@ def get_account_summary(
     
     **Requires authentication**
     """
-    if current_user.id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User ID is required"
-        )
     return AccountService.get_account_summary(session, current_user.id)
 
 
@@ -138,12 +123,9 @@ def get_account(
     
     **Requires authentication**
     """
-    if current_user.id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User ID is required"
-        )
-    account = AccountService.get_account_by_id(session, account_id, current_user.id)
+    account = AccountService.get_account_by_id(
+        session, account_id, current_user.id, load_relations=True
+    )
     
     if not account:
         raise HTTPException(
@@ -166,11 +148,6 @@ def update_account(
     
     **Requires authentication**
     """
-    if current_user.id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User ID is required"
-        )
     return AccountService.update_account(
         session, account_id, account_update, current_user.id
     )
@@ -191,10 +168,5 @@ def delete_account(
     
     **Requires authentication**
     """
-    if current_user.id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User ID is required"
-        )
     AccountService.delete_account(session, account_id, current_user.id)
     return None
\ No newline at end of file
@@ -2,12 +2,15 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
 from app.database import get_session
 from app.models.user import (
-    User, UserCreate, UserRead, UserLogin, UserProfile,
+    User, UserCreate, UserRead, UserLogin, UserProfile, UserClaims,
     TokenResponse, RefreshTokenRequest, ChangePasswordRequest, UserUpdate
 )
 from app.services.user_service import UserService
 from app.core.security import create_access_token, create_refresh_token, decode_token, verify_token_type
-from app.core.dependencies import get_current_user
+from app.core.dependencies import (
+    get_current_user, get_current_user_claims, invalidate_user_cache,
+    revoke_token, _extract_bearer
+)
 from app.services.category_service import create_default_categories
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
@@ -54,9 +57,11 @@ def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Create tokens
-    access_token = create_access_token(data={"sub": str(user.id)})
-    refresh_token = create_refresh_token(data={"sub": str(user.id)})
+    # Create tokens - identity claims ride along so /me and /logout can be
+    # answered from the token alone, without a user SELECT
+    token_data = {"sub": str(user.id), "email": user.email, "name": user.name}
+    access_token = create_access_token(data=token_data)
+    refresh_token = create_refresh_token(data=token_data)
     
     return TokenResponse(
         access_token=access_token,
@@ -104,9 +109,10 @@ def refresh_token(
             detail="User not found"
         )
     
-    # Create new tokens
-    access_token = create_access_token(data={"sub": str(user.id)})
-    new_refresh_token = create_refresh_token(data={"sub": str(user.id)})
+    # Create new tokens (re-embedding identity claims from the fresh row)
+    token_data = {"sub": str(user.id), "email": user.email, "name": user.name}
+    access_token = create_access_token(data=token_data)
+    new_refresh_token = create_refresh_token(data=token_data)
     
     return TokenResponse(
         access_token=access_token,
@@ -115,22 +121,18 @@ def refresh_token(
 
 
 @router.get("/me", response_model=UserProfile)
-def get_me(current_user: User = Depends(get_current_user)):
+def get_me(claims: UserClaims = Depends(get_current_user_claims)):
     """
     Get current authenticated user profile
-    
+
+    Served straight from the verified JWT claims - no DB round trip
+
     **Requires authentication**
     """
-    if current_user.id is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="User ID is missing"
-        )
-    
-    return UserProfile(
-        id=current_user.id,
-        email=current_user.email,
-        name=current_user.name
+    return UserProfile.model_construct(
+        id=claims.id,
+        email=claims.email,
+        name=claims.name
     )
 
 
@@ -157,7 +159,11 @@ def update_me(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="User ID is missing"
         )
-    
+
+    # Drop cached token snapshots so the new name/email is visible on the
+    # very next request, not after the cache entry expires
+    invalidate_user_cache(updated_user.id)
+
     return UserProfile(
         id=updated_user.id,
         email=updated_user.email,
@@ -182,17 +188,32 @@ def change_password(
         current_password=request.current_password,
         new_password=request.new_password
     )
-    
+
+    # Drop cached tokens so old credentials stop resolving immediately
+    if current_user.id is not None:
+        invalidate_user_cache(current_user.id)
+
     return {"message": "Password changed successfully"}
 
 
 @router.post("/logout")
-def logout(current_user: User = Depends(get_current_user)):
+def logout(
+    claims: UserClaims = Depends(get_current_user_claims),
+    token: str = Depends(_extract_bearer)
+):
     """
     Logout (client should discard tokens)
-    
+
     **Requires authentication**
-    
-    Note: JWT tokens are stateless, so logout is handled client-side
+
+    The presented access token is added to the revocation list (when Redis
+    is configured) and the server-side auth cache is cleared. Identity comes
+    from the JWT claims, so no DB session is opened.
     """
+    # Revoke the presented token until it would have expired naturally
+    revoke_token(token)
+
+    # Drop cached tokens for this user server-side
+    invalidate_user_cache(claims.id)
+
     return {"message": "Logged out successfully"}
\ No newline at end of file
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlmodel import Session
 from typing import Optional
 
@@ -59,13 +60,21 @@ def get_categories(
     - **parent_id**: Get categories under a specific parent (null = root only)
     - **include_children**: Include subcategories in results
     """
-    return CategoryService.get_categories(
+    categories = CategoryService.get_categories(
         session, 
         current_user, 
         type=type,
         parent_id=parent_id,
         include_children=include_children
     )
+    # Validate once with the bound pydantic-core validator and return a
+    # Response directly: skips FastAPI's second response_model pass and the
+    # jsonable_encoder walk per row (response_model stays for OpenAPI)
+    validate_category = CategoryRead.__pydantic_validator__.validate_python
+    return ORJSONResponse(content=[
+        validate_category(category, from_attributes=True).model_dump(mode="json")
+        for category in categories
+    ])
 
 
 @router.get(
@@ -83,7 +92,11 @@ def get_category_tree(
     
     Returns nested JSON with parent-child relationships.
     """
-    return CategoryService.get_category_tree(session, current_user, type=type)
+    # The tree is already plain dicts - hand it straight to orjson, no
+    # per-node validation or encoder walk
+    return ORJSONResponse(content=CategoryService.get_category_tree(
+        session, current_user, type=type
+    ))
 
 
 @router.get(
@@ -99,7 +112,12 @@ def get_categories_by_type(
     """
     Get all categories filtered by type (income or expense).
     """
-    return CategoryService.get_categories(session, current_user, type=type)
+    categories = CategoryService.get_categories(session, current_user, type=type)
+    validate_category = CategoryRead.__pydantic_validator__.validate_python
+    return ORJSONResponse(content=[
+        validate_category(category, from_attributes=True).model_dump(mode="json")
+        for category in categories
+    ])
 
 
 @router.get(
@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlmodel import Session
+from typing import List
+from app.database import get_session
+from app.models.user import User
+from app.models.transaction import TransactionCreate, TransactionRead
+from app.core.dependencies import get_current_user
+from app.services.transaction_service import TransactionService
+
+router = APIRouter(prefix="/api/transactions", tags=["Transactions"])
+
+
+@router.post("", response_model=TransactionRead, status_code=status.HTTP_201_CREATED)
+def create_transaction(
+    transaction: TransactionCreate,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """
+    Create a new transaction with its debit/credit lines
+
+    Lines must balance (total debits == total credits)
+
+    **Requires authentication**
+    """
+    return TransactionService.create_transaction(session, transaction, current_user.id)
+
+
+@router.get("", response_model=List[TransactionRead])
+def list_transactions(
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """
+    Get list of transactions with their lines
+
+    **Requires authentication**
+    """
+    skip = (page - 1) * page_size
+    return TransactionService.get_transactions(
+        session, current_user.id, skip=skip, limit=page_size
+    )
+
+
+@router.get("/{transaction_id}", response_model=TransactionRead)
+def get_transaction(
+    transaction_id: int,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """
+    Get a specific transaction with its lines
+
+    **Requires authentication**
+    """
+    transaction = TransactionService.get_transaction_by_id(
+        session, transaction_id, current_user.id
+    )
+
+    if not transaction:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transaction not found"
+        )
+
+    return transaction
@@ -1,30 +1,63 @@
 from sqlmodel import Session, select, or_, func
+from sqlalchemy import exists, lambda_stmt
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
-from typing import Optional, List
+from itertools import chain
+from typing import Iterator, Optional, List
 from decimal import Decimal
-from app.models.account import Account, AccountType, AccountCreate, AccountUpdate
+from app.models.account import Account, AccountType, AccountCreate, AccountUpdate, AccountTree
 
 
 class AccountService:
     """Service layer for account operations"""
     
     @staticmethod
-    def get_account_by_id(session: Session, account_id: int, user_id: int) -> Optional[Account]:
-        """Get account by ID for specific user"""
-        statement = select(Account).where(
-            Account.id == account_id,
-            Account.user_id == user_id
-        )
-        return session.exec(statement).first()
+    def get_account_by_id(
+        session: Session,
+        account_id: int,
+        user_id: int,
+        load_relations: bool = False
+    ) -> Optional[Account]:
+        """
+        Get account by ID for specific user
+
+        With load_relations=True the parent and children are eager-loaded in
+        the same round trip (joined load for the many-to-one parent, selectin
+        for the children collection), so serializing AccountDetail doesn't
+        fire one lazy SELECT per relationship afterwards
+
+        Uses session.get rather than select(): the identity map answers
+        repeated lookups of the same account within a request (update flows
+        validate the target and then the parent) with no SQL at all
+        """
+        if load_relations:
+            account = session.get(
+                Account, account_id,
+                options=(
+                    joinedload(Account.parent),  # type: ignore
+                    selectinload(Account.children)  # type: ignore
+                )
+            )
+        else:
+            account = session.get(Account, account_id)
+        if account is None or account.user_id != user_id:
+            return None
+        return account
     
     @staticmethod
     def get_account_by_code(session: Session, code: str, user_id: int) -> Optional[Account]:
         """Get account by code for specific user"""
-        statement = select(Account).where(
-            Account.code == code,
-            Account.user_id == user_id
+        # lambda_stmt caches the constructed statement by the lambda's code
+        # location, so repeat calls only bind the two parameters instead of
+        # rebuilding and re-analyzing the select each time
+        statement = lambda_stmt(
+            lambda: select(Account).where(
+                Account.code == code,
+                Account.user_id == user_id
+            )
         )
-        return session.exec(statement).first()
+        return session.execute(statement).scalars().first()
     
     @staticmethod
     def create_account(
@@ -33,14 +66,6 @@ class AccountService:
         user_id: int
     ) -> Account:
         """Create a new account"""
-        # Check if code already exists
-        existing = AccountService.get_account_by_code(session, account_data.code, user_id)
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Account code '{account_data.code}' already exists"
-            )
-        
         # Validate parent account if provided
         if account_data.parent_id:
             parent = AccountService.get_account_by_id(session, account_data.parent_id, user_id)
@@ -64,9 +89,18 @@ class AccountService:
         )
         
         session.add(account)
-        session.commit()
-        session.refresh(account)
-        
+        # No pre-check SELECT for the code: the (user_id, code) unique
+        # constraint catches duplicates atomically, race-free
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Account code '{account_data.code}' already exists"
+            )
+        # eager_defaults already brought back the server-side columns in the
+        # write's RETURNING clause - no refresh SELECT needed
         return account
     
     @staticmethod
@@ -85,15 +119,6 @@ class AccountService:
                 detail="Account not found"
             )
         
-        # Check if new code conflicts with existing
-        if account_data.code and account_data.code != account.code:
-            existing = AccountService.get_account_by_code(session, account_data.code, user_id)
-            if existing:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Account code '{account_data.code}' already exists"
-                )
-        
         # Validate parent account if changed
         if account_data.parent_id is not None and account_data.parent_id != account.parent_id:
             # Prevent circular reference
@@ -110,18 +135,26 @@ class AccountService:
                     detail="Parent account not found"
                 )
         
-        # Update fields
-        update_data = account_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(account, field, value)
-        
-        from datetime import datetime
-        account.updated_at = datetime.utcnow()
-        
+        # Update fields - reading __pydantic_fields_set__ touches only what
+        # the caller actually sent, where model_dump(exclude_unset=True)
+        # walked the whole schema and allocated a dict for a 1-2 field patch.
+        # updated_at is handled by the column's onupdate=func.now()
+        for field in account_data.__pydantic_fields_set__:
+            setattr(account, field, getattr(account_data, field))
+
         session.add(account)
-        session.commit()
-        session.refresh(account)
-        
+        # Code conflicts surface as IntegrityError from the unique
+        # constraint instead of a pre-check SELECT
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Account code '{account_data.code}' already exists"
+            )
+        # eager_defaults already brought back the server-side columns in the
+        # write's RETURNING clause - no refresh SELECT needed
         return account
     
     @staticmethod
@@ -135,10 +168,18 @@ class AccountService:
                 detail="Account not found"
             )
         
-        # Check if account has children
-        statement = select(Account).where(Account.parent_id == account_id)
-        children = session.exec(statement).first()
-        if children:
+        # Check if account has children - EXISTS lets the planner stop at
+        # the first index hit with no row hydration; scoped by user so the
+        # (user_id, parent_id) index serves the lookup (children always
+        # share their parent's user)
+        statement = select(
+            exists().where(
+                Account.user_id == user_id,
+                Account.parent_id == account_id
+            )
+        )
+        has_children = session.exec(statement).one()
+        if has_children:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete account with child accounts. Delete or reassign children first."
@@ -165,97 +206,150 @@ class AccountService:
         search: Optional[str] = None,
         skip: int = 0,
         limit: int = 100
-    ) -> tuple[List[Account], int]:
-        """Get list of accounts with filters"""
-        # Build query
-        statement = select(Account).where(Account.user_id == user_id)
-        
-        # Apply filters
+    ) -> tuple[Iterator[Account], int]:
+        """
+        Get accounts matching the filters, plus the total match count
+
+        Returns an iterator rather than a list: rows are fetched from the
+        DB in yield_per batches, so callers that stream the response never
+        hold the whole page in memory at once
+        """
+        # Build the filter criteria once, shared by the page query and the
+        # empty-page count fallback
+        criteria = [Account.user_id == user_id]
+
         if account_type:
-            statement = statement.where(Account.type == account_type)
-        
+            criteria.append(Account.type == account_type)
+
         if is_active is not None:
-            statement = statement.where(Account.is_active == is_active)
-        
+            criteria.append(Account.is_active == is_active)
+
         if search:
             search_term = f"%{search}%"
-            statement = statement.where(
+            criteria.append(
                 or_(
                     Account.code.ilike(search_term),  # type: ignore
                     Account.name.ilike(search_term),  # type: ignore
                     Account.description.ilike(search_term)  # type: ignore
                 )
             )
-        
-        # Get total count
-        count_statement = select(func.count()).select_from(statement.subquery())
-        total = session.exec(count_statement).one()
-        
-        # Apply pagination and ordering
-        statement = statement.offset(skip).limit(limit).order_by(Account.code)
-        
-        accounts = session.exec(statement).all()
-        
-        return list(accounts), total
+
+        # The window-function count rides along with the page rows, so one
+        # round trip returns both instead of a separate COUNT query;
+        # yield_per still streams rows in batches
+        statement = (
+            select(Account, func.count().over().label("total"))
+            .where(*criteria)
+            .order_by(Account.code)
+            .offset(skip)
+            .limit(limit)
+            .execution_options(yield_per=500)
+        )
+
+        rows = iter(session.exec(statement))
+        try:
+            first_account, total = next(rows)
+        except StopIteration:
+            # Page starts past the last match (or nothing matches): no rows
+            # came back carrying the window count, so fall back to a COUNT
+            # over the same criteria list - counting the primary key keeps
+            # it an index-only scan, no subquery to materialize
+            count_statement = select(func.count(Account.id)).where(*criteria)
+            return iter(()), session.exec(count_statement).one()
+
+        accounts = chain((first_account,), (account for account, _ in rows))
+        return accounts, total
     
     @staticmethod
-    def get_account_tree(session: Session, user_id: int) -> List[Account]:
-        """Get hierarchical account structure (root accounts only)"""
+    def get_account_tree(session: Session, user_id: int) -> List[AccountTree]:
+        """
+        Get hierarchical account structure (tree of AccountTree nodes)
+
+        Fetches every account for the user in a single query and assembles
+        the tree in memory from a parent_id index. The old approach returned
+        root accounts and walked account.children recursively, which lazy-
+        loaded one SELECT per node; raiseload guards against that pattern
+        sneaking back in.
+        """
         statement = select(Account).where(
-            Account.user_id == user_id,
-            Account.parent_id == None  # ✅ Changed from == None to is None
-        ).order_by(Account.code)
-        
-        return list(session.exec(statement).all())
+            Account.user_id == user_id
+        ).order_by(Account.code).options(raiseload('*'))
+        accounts = session.exec(statement).all()
+
+        # One pass: build a node per account, then attach each node to its
+        # parent (accounts are code-ordered, so children come out sorted).
+        # model_construct skips per-node pydantic validation - the values
+        # come straight from the DB and are already the right types, so only
+        # the minor-units conversion has to happen by hand
+        nodes = {
+            account.id: AccountTree.model_construct(
+                id=account.id,
+                code=account.code,
+                name=account.name,
+                type=account.type,
+                balance=Decimal(account.balance).scaleb(-2),
+                is_active=account.is_active,
+                children=[]
+            )
+            for account in accounts
+        }
+
+        roots: List[AccountTree] = []
+        for account in accounts:
+            node = nodes[account.id]
+            if account.parent_id is None:
+                roots.append(node)
+            else:
+                nodes[account.parent_id].children.append(node)
+
+        return roots
     
     @staticmethod
     def get_account_summary(session: Session, user_id: int) -> dict:
-        """Get account summary statistics"""
-        # Count by type
+        """Get account summary statistics (active accounts only)"""
+        # FILTER-clause aggregates: the DB does the per-type branching in a
+        # single pass and hands back exactly one row, replacing the old
+        # GROUP BY + if/elif mapping loop in Python. coalesce keeps the
+        # no-rows-of-a-type edge case in SQL instead of patching it up here
+        def count_of(account_type: AccountType):
+            return func.count().filter(Account.type == account_type)
+
+        def balance_of(account_type: AccountType):
+            return func.coalesce(
+                func.sum(Account.balance).filter(Account.type == account_type),
+                0
+            )
+
         statement = select(
-            Account.type,
-            func.count().label('count'),
-            func.sum(Account.balance).label('total_balance')
+            func.count().label('total_accounts'),
+            count_of(AccountType.ASSET).label('assets_count'),
+            count_of(AccountType.LIABILITY).label('liabilities_count'),
+            count_of(AccountType.EQUITY).label('equity_count'),
+            count_of(AccountType.REVENUE).label('revenue_count'),
+            count_of(AccountType.EXPENSE).label('expense_count'),
+            balance_of(AccountType.ASSET).label('total_assets'),
+            balance_of(AccountType.LIABILITY).label('total_liabilities'),
+            balance_of(AccountType.EQUITY).label('total_equity'),
+            balance_of(AccountType.REVENUE).label('total_revenue'),
+            balance_of(AccountType.EXPENSE).label('total_expenses')
         ).where(
-            Account.user_id == user_id
-        ).group_by(Account.type)
-        
-        results = session.exec(statement).all()
-        
-        summary = {
-            "total_accounts": 0,
-            "assets_count": 0,
-            "liabilities_count": 0,
-            "equity_count": 0,
-            "revenue_count": 0,
-            "expense_count": 0,
-            "total_assets": Decimal("0.00"),
-            "total_liabilities": Decimal("0.00"),
-            "total_equity": Decimal("0.00"),
-            "total_revenue": Decimal("0.00"),
-            "total_expenses": Decimal("0.00")
-        }
-        
-        for row in results:
-            account_type, count, balance = row
-            balance = balance or Decimal("0.00")
-            
-            summary["total_accounts"] += count
-            
-            if account_type == AccountType.ASSET:
-                summary["assets_count"] = count
-                summary["total_assets"] = balance
-            elif account_type == AccountType.LIABILITY:
-                summary["liabilities_count"] = count
-                summary["total_liabilities"] = balance
-            elif account_type == AccountType.EQUITY:
-                summary["equity_count"] = count
-                summary["total_equity"] = balance
-            elif account_type == AccountType.REVENUE:
-                summary["revenue_count"] = count
-                summary["total_revenue"] = balance
-            elif account_type == AccountType.EXPENSE:
-                summary["expense_count"] = count
-                summary["total_expenses"] = balance
-        
-        return summary
\ No newline at end of file
+            Account.user_id == user_id,
+            Account.is_active.is_(True)  # type: ignore
+        )
+
+        row = session.exec(statement).one()
+
+        # Balances are aggregated as int64 minor units; convert once here
+        return {
+            "total_accounts": row.total_accounts,
+            "assets_count": row.assets_count,
+            "liabilities_count": row.liabilities_count,
+            "equity_count": row.equity_count,
+            "revenue_count": row.revenue_count,
+            "expense_count": row.expense_count,
+            "total_assets": Decimal(row.total_assets).scaleb(-2),
+            "total_liabilities": Decimal(row.total_liabilities).scaleb(-2),
+            "total_equity": Decimal(row.total_equity).scaleb(-2),
+            "total_revenue": Decimal(row.total_revenue).scaleb(-2),
+            "total_expenses": Decimal(row.total_expenses).scaleb(-2)
+        }
\ No newline at end of file
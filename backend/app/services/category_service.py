@@ -1,6 +1,8 @@
 from sqlmodel import Session, select, col
+from sqlalchemy import exists, insert
 from typing import Optional
 from app.models import Category, CategoryCreate, CategoryUpdate, CategoryType, User
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
 
@@ -38,26 +40,20 @@ class CategoryService:
                     detail="Parent category must have the same type (income/expense)"
                 )
         
-        # Check for duplicate name under the same parent
-        statement = select(Category).where(
-            Category.user_id == user.id,
-            Category.name == category_data.name,
-            Category.parent_id == category_data.parent_id
-        )
-        existing = session.exec(statement).first()
-        
-        if existing:
+        # Create category; duplicate names under the same parent hit the
+        # unique constraint instead of a pre-check SELECT
+        category = Category.model_validate(category_data, update={"user_id": user.id})
+        session.add(category)
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Category with this name already exists under the same parent"
             )
-        
-        # Create category
-        category = Category.model_validate(category_data, update={"user_id": user.id})
-        session.add(category)
-        session.commit()
-        session.refresh(category)
-        
+        # eager_defaults already brought back the server-side columns in the
+        # write's RETURNING clause - no refresh SELECT needed
         return category
     
     @staticmethod
@@ -160,15 +156,16 @@ class CategoryService:
                     detail="Parent category must have the same type"
                 )
         
-        # Update fields
-        update_data = category_update.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(category, key, value)
+        # Update fields - reading __pydantic_fields_set__ touches only what
+        # the caller actually sent, where model_dump(exclude_unset=True)
+        # walked the whole schema and allocated a dict for a 1-2 field patch
+        for key in category_update.__pydantic_fields_set__:
+            setattr(category, key, getattr(category_update, key))
         
         session.add(category)
         session.commit()
-        session.refresh(category)
-        
+        # eager_defaults already brought back the server-side columns in the
+        # write's RETURNING clause - no refresh SELECT needed
         return category
     
     @staticmethod
@@ -177,11 +174,12 @@ class CategoryService:
         
         category = CategoryService.get_category(session, category_id, user)
         
-        # Check if category has children
-        statement = select(Category).where(Category.parent_id == category_id)
-        children = session.exec(statement).first()
-        
-        if children:
+        # Check if category has children - EXISTS lets the planner stop at
+        # the first matching row without hydrating a Category object
+        statement = select(exists().where(Category.parent_id == category_id))
+        has_children = session.exec(statement).one()
+
+        if has_children:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete category with subcategories. Delete children first."
@@ -212,64 +210,196 @@ class CategoryService:
         # Get all categories
         categories = CategoryService.get_categories(session, user, type=type)
         
-        # Build tree structure
-        category_map = {cat.id: cat for cat in categories}
-        tree = []
+        # Two linear passes, no recursion: build every node dict up front,
+        # then attach each node to its parent. Same approach as the account
+        # tree; child ordering follows the name-ordered query
+        nodes = {
+            category.id: {
+                "id": category.id,
+                "name": category.name,
+                "type": category.type,
+                "icon": category.icon,
+                "color": category.color,
+                "parent_id": category.parent_id,
+                "children": []
+            }
+            for category in categories
+        }
         
+        tree: list[dict] = []
         for category in categories:
+            node = nodes[category.id]
             if category.parent_id is None:
-                # Root category
-                tree.append(CategoryService._build_tree_node(category, category_map))
+                tree.append(node)
+            else:
+                parent = nodes.get(category.parent_id)
+                if parent is not None:
+                    parent["children"].append(node)
         
         return tree
     
-    @staticmethod
-    def _build_tree_node(category: Category, category_map: dict) -> dict:
-        """Recursively build tree node with children"""
-        
-        node = {
-            "id": category.id,
-            "name": category.name,
-            "type": category.type,
-            "icon": category.icon,
-            "color": category.color,
-            "parent_id": category.parent_id,
-            "children": []
-        }
-        
-        # Find children
-        for cat_id, cat in category_map.items():
-            if cat.parent_id == category.id:
-                node["children"].append(
-                    CategoryService._build_tree_node(cat, category_map)
-                )
-        
-        return node
-    
     @staticmethod
     def _creates_circular_reference(
         session: Session, 
         category_id: int, 
-        new_parent_id: int
+        new_parent_id: int,
+        index: Optional[dict[int, Category]] = None
     ) -> bool:
-        """Check if setting new_parent_id would create a circular reference"""
-        
-        current_id = new_parent_id
-        max_depth = 100  # Prevent infinite loop
-        depth = 0
-        
-        while current_id is not None and depth < max_depth:
-            if current_id == category_id:
-                return True  # Circular reference detected
-            
-            category = session.get(Category, current_id)
-            if not category:
-                break
-            
-            current_id = category.parent_id
-            depth += 1
-        
-        return False
+        """
+        Check if setting new_parent_id would create a circular reference
+
+        Callers that already hold every category in memory (bulk edits load
+        the whole tree once) can pass it as index; the ancestor walk then
+        runs in pure Python with zero queries
+        """
+        if new_parent_id == category_id:
+            return True
+
+        if index is not None:
+            # Track visited ids so a pre-existing cycle (possible if two
+            # concurrent parent updates both passed this check) terminates
+            # instead of looping forever
+            visited: set[int] = set()
+            current_id: Optional[int] = new_parent_id
+            while current_id is not None and current_id not in visited:
+                if current_id == category_id:
+                    return True
+                visited.add(current_id)
+                current = index.get(current_id)
+                current_id = current.parent_id if current else None
+            return False
+
+        # Fetch the whole ancestor chain of the proposed parent with one
+        # recursive CTE, then check membership in Python. The old loop did
+        # one session.get per ancestor - up to a round trip per tree level.
+        # UNION (not UNION ALL): deduplication stops the recursion even if
+        # a parent cycle already exists in the data, where UNION ALL would
+        # recurse unboundedly and hang the query
+        ancestors = (
+            select(col(Category.id), col(Category.parent_id))
+            .where(Category.id == new_parent_id)
+            .cte(recursive=True)
+        )
+        ancestors = ancestors.union(
+            select(col(Category.id), col(Category.parent_id)).join(
+                ancestors, col(Category.id) == ancestors.c.parent_id
+            )
+        )
+        ancestor_ids = session.exec(select(ancestors.c.id)).all()  # type: ignore
+
+        return category_id in ancestor_ids
+
+
+# Seed data for new users, built once at import. The seeding code only
+# reads from it (no pop/mutation), so one shared structure serves every
+# signup without rebuilding dozens of dicts per call
+_DEFAULT_CATEGORIES: tuple = (
+    # Income Categories
+    {
+        "name": "Salary",
+        "type": CategoryType.INCOME,
+        "icon": "💰",
+        "color": "#4CAF50"
+    },
+    {
+        "name": "Business Income",
+        "type": CategoryType.INCOME,
+        "icon": "💼",
+        "color": "#2196F3"
+    },
+    {
+        "name": "Investment Income",
+        "type": CategoryType.INCOME,
+        "icon": "📈",
+        "color": "#9C27B0"
+    },
+    {
+        "name": "Gifts Received",
+        "type": CategoryType.INCOME,
+        "icon": "🎁",
+        "color": "#E91E63"
+    },
+    {
+        "name": "Other Income",
+        "type": CategoryType.INCOME,
+        "icon": "💵",
+        "color": "#00BCD4"
+    },
+    
+    # Expense Categories - Parents
+    {
+        "name": "Food & Dining",
+        "type": CategoryType.EXPENSE,
+        "icon": "🍔",
+        "color": "#FF5722",
+        "children": [
+            {"name": "Groceries", "icon": "🛒", "color": "#FF5722"},
+            {"name": "Restaurants", "icon": "🍽️", "color": "#FF5722"},
+            {"name": "Coffee Shops", "icon": "☕", "color": "#FF5722"}
+        ]
+    },
+    {
+        "name": "Housing",
+        "type": CategoryType.EXPENSE,
+        "icon": "🏠",
+        "color": "#795548",
+        "children": [
+            {"name": "Rent", "icon": "🏘️", "color": "#795548"},
+            {"name": "Utilities", "icon": "💡", "color": "#795548"},
+            {"name": "Home Maintenance", "icon": "🔧", "color": "#795548"}
+        ]
+    },
+    {
+        "name": "Transportation",
+        "type": CategoryType.EXPENSE,
+        "icon": "🚗",
+        "color": "#607D8B",
+        "children": [
+            {"name": "Gas", "icon": "⛽", "color": "#607D8B"},
+            {"name": "Public Transit", "icon": "🚌", "color": "#607D8B"},
+            {"name": "Car Maintenance", "icon": "🔧", "color": "#607D8B"}
+        ]
+    },
+    {
+        "name": "Shopping",
+        "type": CategoryType.EXPENSE,
+        "icon": "🛍️",
+        "color": "#E91E63",
+        "children": [
+            {"name": "Clothing", "icon": "👕", "color": "#E91E63"},
+            {"name": "Electronics", "icon": "💻", "color": "#E91E63"},
+            {"name": "Personal Care", "icon": "💄", "color": "#E91E63"}
+        ]
+    },
+    {
+        "name": "Entertainment",
+        "type": CategoryType.EXPENSE,
+        "icon": "🎮",
+        "color": "#9C27B0",
+        "children": [
+            {"name": "Movies", "icon": "🎬", "color": "#9C27B0"},
+            {"name": "Games", "icon": "🎮", "color": "#9C27B0"},
+            {"name": "Hobbies", "icon": "🎨", "color": "#9C27B0"}
+        ]
+    },
+    {
+        "name": "Healthcare",
+        "type": CategoryType.EXPENSE,
+        "icon": "🏥",
+        "color": "#F44336",
+        "children": [
+            {"name": "Doctor", "icon": "👨‍⚕️", "color": "#F44336"},
+            {"name": "Pharmacy", "icon": "💊", "color": "#F44336"},
+            {"name": "Insurance", "icon": "🛡️", "color": "#F44336"}
+        ]
+    },
+    {
+        "name": "Other Expenses",
+        "type": CategoryType.EXPENSE,
+        "icon": "📦",
+        "color": "#9E9E9E"
+    }
+)
 
 
 def create_default_categories(session: Session, user: User) -> None:
@@ -278,139 +408,37 @@ def create_default_categories(session: Session, user: User) -> None:
     if user.id is None:
         raise ValueError("User must have an ID to create default categories")
     
-    default_categories = [
-        # Income Categories
-        {
-            "name": "Salary",
-            "type": CategoryType.INCOME,
-            "icon": "💰",
-            "color": "#4CAF50"
-        },
-        {
-            "name": "Business Income",
-            "type": CategoryType.INCOME,
-            "icon": "💼",
-            "color": "#2196F3"
-        },
-        {
-            "name": "Investment Income",
-            "type": CategoryType.INCOME,
-            "icon": "📈",
-            "color": "#9C27B0"
-        },
-        {
-            "name": "Gifts Received",
-            "type": CategoryType.INCOME,
-            "icon": "🎁",
-            "color": "#E91E63"
-        },
-        {
-            "name": "Other Income",
-            "type": CategoryType.INCOME,
-            "icon": "💵",
-            "color": "#00BCD4"
-        },
-        
-        # Expense Categories - Parents
+    # Two batched statements instead of a flush per parent: one INSERT
+    # RETURNING for all parents (ordered to match the input rows), then one
+    # executemany INSERT for all children
+    parent_rows = [
         {
-            "name": "Food & Dining",
-            "type": CategoryType.EXPENSE,
-            "icon": "🍔",
-            "color": "#FF5722",
-            "children": [
-                {"name": "Groceries", "icon": "🛒", "color": "#FF5722"},
-                {"name": "Restaurants", "icon": "🍽️", "color": "#FF5722"},
-                {"name": "Coffee Shops", "icon": "☕", "color": "#FF5722"}
-            ]
-        },
-        {
-            "name": "Housing",
-            "type": CategoryType.EXPENSE,
-            "icon": "🏠",
-            "color": "#795548",
-            "children": [
-                {"name": "Rent", "icon": "🏘️", "color": "#795548"},
-                {"name": "Utilities", "icon": "💡", "color": "#795548"},
-                {"name": "Home Maintenance", "icon": "🔧", "color": "#795548"}
-            ]
-        },
-        {
-            "name": "Transportation",
-            "type": CategoryType.EXPENSE,
-            "icon": "🚗",
-            "color": "#607D8B",
-            "children": [
-                {"name": "Gas", "icon": "⛽", "color": "#607D8B"},
-                {"name": "Public Transit", "icon": "🚌", "color": "#607D8B"},
-                {"name": "Car Maintenance", "icon": "🔧", "color": "#607D8B"}
-            ]
-        },
-        {
-            "name": "Shopping",
-            "type": CategoryType.EXPENSE,
-            "icon": "🛍️",
-            "color": "#E91E63",
-            "children": [
-                {"name": "Clothing", "icon": "👕", "color": "#E91E63"},
-                {"name": "Electronics", "icon": "💻", "color": "#E91E63"},
-                {"name": "Personal Care", "icon": "💄", "color": "#E91E63"}
-            ]
-        },
-        {
-            "name": "Entertainment",
-            "type": CategoryType.EXPENSE,
-            "icon": "🎮",
-            "color": "#9C27B0",
-            "children": [
-                {"name": "Movies", "icon": "🎬", "color": "#9C27B0"},
-                {"name": "Games", "icon": "🎮", "color": "#9C27B0"},
-                {"name": "Hobbies", "icon": "🎨", "color": "#9C27B0"}
-            ]
-        },
-        {
-            "name": "Healthcare",
-            "type": CategoryType.EXPENSE,
-            "icon": "🏥",
-            "color": "#F44336",
-            "children": [
-                {"name": "Doctor", "icon": "👨‍⚕️", "color": "#F44336"},
-                {"name": "Pharmacy", "icon": "💊", "color": "#F44336"},
-                {"name": "Insurance", "icon": "🛡️", "color": "#F44336"}
-            ]
-        },
-        {
-            "name": "Other Expenses",
-            "type": CategoryType.EXPENSE,
-            "icon": "📦",
-            "color": "#9E9E9E"
+            "user_id": user.id,
+            "name": cat_data["name"],
+            "type": cat_data["type"],
+            "icon": cat_data.get("icon"),
+            "color": cat_data.get("color")
         }
+        for cat_data in _DEFAULT_CATEGORIES
     ]
+    parent_ids = session.execute(
+        insert(Category).returning(Category.id, sort_by_parameter_order=True),
+        parent_rows
+    ).scalars().all()
     
-    # Create categories
-    for cat_data in default_categories:
-        children_data = cat_data.pop("children", [])
-        
-        # Create parent category
-        parent_category = Category(
-            user_id=user.id,
-            name=cat_data["name"],
-            type=cat_data["type"],
-            icon=cat_data.get("icon"),
-            color=cat_data.get("color")
-        )
-        session.add(parent_category)
-        session.flush()  # Get the ID without committing
-        
-        # Create children categories
-        for child_data in children_data:
-            child_category = Category(
-                user_id=user.id,
-                parent_id=parent_category.id,
-                name=child_data["name"],
-                type=cat_data["type"],
-                icon=child_data.get("icon"),
-                color=child_data.get("color")
-            )
-            session.add(child_category)
+    child_rows = [
+        {
+            "user_id": user.id,
+            "parent_id": parent_id,
+            "name": child_data["name"],
+            "type": cat_data["type"],
+            "icon": child_data.get("icon"),
+            "color": child_data.get("color")
+        }
+        for cat_data, parent_id in zip(_DEFAULT_CATEGORIES, parent_ids)
+        for child_data in cat_data.get("children", ())
+    ]
+    if child_rows:
+        session.execute(insert(Category), child_rows)
     
     session.commit()
\ No newline at end of file
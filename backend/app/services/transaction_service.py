@@ -0,0 +1,130 @@
+from sqlmodel import Session, select, col, func
+from sqlalchemy import insert
+from fastapi import HTTPException, status
+from typing import Optional, List
+from app.models.account import Account
+from app.models.category import Category
+from app.models.transaction import (
+    Transaction, TransactionLine, TransactionCreate, TransactionType, LineType
+)
+
+
+class TransactionService:
+    """Service layer for transaction operations"""
+
+    @staticmethod
+    def get_transaction_by_id(
+        session: Session, transaction_id: int, user_id: int
+    ) -> Optional[Transaction]:
+        """Get transaction by ID for specific user"""
+        statement = select(Transaction).where(
+            Transaction.id == transaction_id,
+            Transaction.user_id == user_id
+        )
+        return session.exec(statement).unique().first()
+
+    @staticmethod
+    def get_transactions(
+        session: Session,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Transaction]:
+        """Get list of transactions (lines ride along via lazy='selectin')"""
+        statement = (
+            select(Transaction)
+            .where(Transaction.user_id == user_id)
+            .order_by(Transaction.date.desc(), Transaction.id.desc())  # type: ignore
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(session.exec(statement).unique().all())
+
+    @staticmethod
+    def create_transaction(
+        session: Session,
+        transaction_data: TransactionCreate,
+        user_id: int
+    ) -> Transaction:
+        """
+        Create a transaction with its lines
+
+        The header is flushed once to obtain its ID, then all lines go in
+        with a single multi-row Core INSERT instead of one ORM INSERT (and
+        PK round trip) per line
+        """
+        if not transaction_data.lines:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Transaction must have at least one line"
+            )
+
+        # Double-entry check: debits and credits must balance
+        total_debit = sum(
+            line.amount for line in transaction_data.lines if line.type == "Debit"
+        )
+        total_credit = sum(
+            line.amount for line in transaction_data.lines if line.type == "Credit"
+        )
+        if total_debit != total_credit:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Transaction debits and credits must balance"
+            )
+
+        # Ownership checks: every referenced account (and the category, if
+        # set) must belong to the caller - one COUNT over the distinct line
+        # account ids instead of a get per line
+        account_ids = {line.account_id for line in transaction_data.lines}
+        owned_count = session.exec(
+            select(func.count(col(Account.id))).where(
+                col(Account.id).in_(account_ids),
+                Account.user_id == user_id
+            )
+        ).one()
+        if owned_count != len(account_ids):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Account not found"
+            )
+
+        if transaction_data.category_id is not None:
+            category = session.get(Category, transaction_data.category_id)
+            if category is None or category.user_id != user_id:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Category not found"
+                )
+
+        transaction = Transaction(
+            user_id=user_id,
+            date=transaction_data.date,
+            # Request schemas carry Literal strings; coerce to the enums once
+            type=TransactionType(transaction_data.type),
+            description=transaction_data.description,
+            reference=transaction_data.reference,
+            notes=transaction_data.notes,
+            is_posted=transaction_data.is_posted,
+            category_id=transaction_data.category_id
+        )
+        session.add(transaction)
+        session.flush()  # Get the transaction ID without committing
+
+        # One executemany INSERT for all lines
+        rows = [
+            {
+                "transaction_id": transaction.id,
+                "account_id": line.account_id,
+                "type": LineType(line.type),
+                # API amounts are Decimal; the column stores integer cents
+                "amount": int(line.amount * 100),
+                "description": line.description,
+            }
+            for line in transaction_data.lines
+        ]
+        session.execute(insert(TransactionLine), rows)
+
+        session.commit()
+        session.refresh(transaction)
+
+        return transaction
@@ -1,39 +1,90 @@
 from sqlmodel import Session, select
+from sqlalchemy import lambda_stmt
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import make_transient_to_detached
 from fastapi import HTTPException, status
+from cachetools import TTLCache
+from app.core.cache import LockedCache
 from app.models.user import User
-from app.core.security import hash_password, verify_password
+from app.core.security import DUMMY_PASSWORD_HASH, hash_password, needs_rehash, verify_password
+from app.utils.seed_accounts import create_default_accounts
 from typing import Optional
 
+# Short-lived snapshot cache for user rows, keyed by user_id. Five seconds
+# is long enough to absorb a burst of requests from one session but short
+# enough that profile edits propagate almost immediately. Values are plain
+# column dicts, never live ORM instances, so no session state leaks between
+# requests. Locked because sync endpoints run concurrently in the
+# threadpool.
+_user_cache = LockedCache(TTLCache(maxsize=10_000, ttl=5))
+
+# Companion cache keyed by email, holding the same snapshots: login and
+# token refresh resolve users by email, everything else by id
+_user_email_cache = LockedCache(TTLCache(maxsize=10_000, ttl=5))
+
+
+def _evict_user(user_id: Optional[int], email: Optional[str]) -> None:
+    """Drop a user's snapshots from both caches after a mutation"""
+    _user_cache.pop(user_id, None)
+    _user_email_cache.pop(email, None)
+
 
 class UserService:
     """Service layer for user operations"""
     
     @staticmethod
     def get_user_by_email(session: Session, email: str) -> Optional[User]:
-        """Get user by email"""
-        statement = select(User).where(User.email == email)
-        user = session.exec(statement).first()
+        """
+        Get user by email
+
+        Snapshot-cached the same way as get_user_by_id; misses are not
+        cached, so probing unknown emails can't churn the cache
+        """
+        user_data = _user_email_cache.get(email)
+        if user_data is not None:
+            user = User(**user_data)
+            make_transient_to_detached(user)
+            return session.merge(user, load=False)
+
+        # lambda_stmt caches the constructed statement by the lambda's code
+        # location; on cache misses only the email bind changes per call
+        statement = lambda_stmt(lambda: select(User).where(User.email == email))
+        user = session.execute(statement).scalars().first()
+        if user is not None:
+            snapshot = user.model_dump()
+            _user_email_cache[email] = snapshot
+            _user_cache[user.id] = snapshot
         return user
     
     @staticmethod
     def get_user_by_id(session: Session, user_id: int) -> Optional[User]:
-        """Get user by ID"""
-        statement = select(User).where(User.id == user_id)
-        user = session.exec(statement).first()
+        """
+        Get user by ID
+
+        Cache-hot lookups skip the SELECT: the snapshot is rehydrated into
+        a fresh instance and merged into the caller's session as persistent,
+        so updates through it still work
+        """
+        user_data = _user_cache.get(user_id)
+        if user_data is not None:
+            user = User(**user_data)
+            make_transient_to_detached(user)
+            return session.merge(user, load=False)
+
+        # Same cached-statement treatment as get_user_by_email
+        statement = lambda_stmt(lambda: select(User).where(User.id == user_id))
+        user = session.execute(statement).scalars().first()
+        if user is not None:
+            snapshot = user.model_dump()
+            _user_cache[user_id] = snapshot
+            _user_email_cache[user.email] = snapshot
         return user
     
     @staticmethod
     def create_user(session: Session, email: str, name: str, password: str) -> User:
         """Create a new user and seed default accounts"""
-        # Check if user already exists
-        existing_user = UserService.get_user_by_email(session, email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        
-        # Create new user
+        # Create new user - no pre-check SELECT: the unique index on email
+        # rejects duplicates atomically, race-free
         hashed_password = hash_password(password)
         user = User(
             email=email,
@@ -42,27 +93,48 @@ class UserService:
         )
         
         session.add(user)
-        session.commit()
-        session.refresh(user)
-        
-        # Create default accounts for new user
-        from app.utils.seed_accounts import create_default_accounts
-        if user.id is not None:
-            create_default_accounts(session, user.id)
-        
+        try:
+            # Flush (not commit) to surface duplicate emails and get the new
+            # id back via RETURNING, then seed the chart of accounts on the
+            # same open transaction: one commit, one fsync, and a failure at
+            # any point rolls the whole signup back - no half-created users
+            session.flush()
+            if user.id is not None:
+                create_default_accounts(session, user.id)
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
+        # No refresh: eager_defaults on User pulls id and the timestamp
+        # defaults back in the INSERT's RETURNING clause
+
         return user
     
     @staticmethod
     def authenticate_user(session: Session, email: str, password: str) -> Optional[User]:
         """Authenticate user with email and password"""
         user = UserService.get_user_by_email(session, email)
-        
+
         if not user:
+            # Burn the same argon2 cost as a real check so response timing
+            # doesn't reveal whether the email exists
+            verify_password(password, DUMMY_PASSWORD_HASH)
             return None
-        
+
         if not verify_password(password, user.password_hash):
             return None
-        
+
+        # Transparent work-factor migration: if BCRYPT_ROUNDS moved since
+        # this hash was minted, re-hash now while the plaintext is in hand
+        if needs_rehash(user.password_hash):
+            user.password_hash = hash_password(password)
+            session.add(user)
+            session.commit()
+            _evict_user(user.id, user.email)
+
         return user
     
     @staticmethod
@@ -73,26 +145,34 @@ class UserService:
         email: Optional[str] = None
     ) -> User:
         """Update user profile"""
+        old_email = user.email
+
         if name:
             user.name = name
         
         if email and email != user.email:
-            # Check if new email already exists
-            existing_user = UserService.get_user_by_email(session, email)
-            if existing_user and existing_user.id != user.id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already in use"
-                )
             user.email = email
-        
-        from datetime import datetime
-        user.updated_at = datetime.utcnow()
-        
+
+        # updated_at is stamped by the column's onupdate=func.now()
         session.add(user)
-        session.commit()
-        session.refresh(user)
-        
+        # Email conflicts surface as IntegrityError from the unique index
+        # instead of a pre-check SELECT
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already in use"
+            )
+        # No refresh: eager_defaults returns the server-stamped columns
+        # with the UPDATE itself, and the session keeps attributes live
+        # after commit
+
+        # Drop the stale snapshots (old email too, in case it changed) so
+        # the new profile is visible immediately
+        _evict_user(user.id, old_email)
+
         return user
     
     @staticmethod
@@ -112,12 +192,12 @@ class UserService:
         
         # Update password
         user.password_hash = hash_password(new_password)
-        
-        from datetime import datetime
-        user.updated_at = datetime.utcnow()
-        
+
+        # updated_at is stamped by the column's onupdate=func.now()
         session.add(user)
         session.commit()
-        session.refresh(user)
-        
+        # No refresh - same reasoning as update_user
+
+        _evict_user(user.id, user.email)
+
         return user
\ No newline at end of file